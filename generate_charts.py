@@ -3,192 +3,130 @@
 Generate comprehensive visualizations for the production planning optimization results
 """
 
-import pulp
+import copy
+import functools
+import json
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
-import warnings
-warnings.filterwarnings('ignore')
+from business_optimization_production_planning import (PLOT_STYLE, UTILIZATION_AXIS_MAX, ProductionPlanningOptimizer,
+                                                        save_or_show, select_backend)
 
-# Set style for better visualizations
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+@functools.lru_cache(maxsize=1)
+def _solve_cached(problem_key):
+    """Solve the optimization problem for JSON-serialized problem data"""
+    data = json.loads(problem_key)
+    optimizer = ProductionPlanningOptimizer()
+    optimizer.products = data['products']
+    optimizer.resources = data['resources']
+    optimizer.min_production = data['min_production']
+    return optimizer.solve_optimization()
 
-def solve_optimization():
-    """Solve the optimization problem and return results"""
-    
-    # Product information
-    products = {
-        'Product_A': {
-            'profit_per_unit': 50,
-            'labor_hours': 2,
-            'machine_hours': 1.5,
-            'raw_material': 3,
-            'max_demand': 100
-        },
-        'Product_B': {
-            'profit_per_unit': 75,
-            'labor_hours': 3,
-            'machine_hours': 2,
-            'raw_material': 4,
-            'max_demand': 80
-        },
-        'Product_C': {
-            'profit_per_unit': 60,
-            'labor_hours': 2.5,
-            'machine_hours': 1.8,
-            'raw_material': 3.5,
-            'max_demand': 120
-        }
-    }
-    
-    # Resource constraints
-    resources = {
-        'labor_hours': 400,
-        'machine_hours': 300,
-        'raw_material': 1000
-    }
-    
-    # Minimum production requirements
-    min_production = {
-        'Product_A': 20,
-        'Product_B': 15,
-        'Product_C': 25
-    }
-    
-    # Create the optimization problem
-    prob = pulp.LpProblem("Production_Planning_Optimization", pulp.LpMaximize)
-    
-    # Decision variables
-    production_vars = pulp.LpVariable.dicts("Production", products.keys(), lowBound=0, cat='Integer')
-    
-    # Objective function: Maximize total profit
-    prob += pulp.lpSum([products[p]['profit_per_unit'] * production_vars[p] for p in products]), "Total_Profit"
-    
-    # Constraints
-    # Labor hours
-    prob += pulp.lpSum([products[p]['labor_hours'] * production_vars[p] for p in products]) <= resources['labor_hours'], "Labor_Hours_Limit"
-    # Machine hours
-    prob += pulp.lpSum([products[p]['machine_hours'] * production_vars[p] for p in products]) <= resources['machine_hours'], "Machine_Hours_Limit"
-    # Raw material
-    prob += pulp.lpSum([products[p]['raw_material'] * production_vars[p] for p in products]) <= resources['raw_material'], "Raw_Material_Limit"
-    # Maximum demand
-    for p in products:
-        prob += production_vars[p] <= products[p]['max_demand'], f"Max_Demand_{p}"
-    # Minimum production
-    for p in products:
-        prob += production_vars[p] >= min_production[p], f"Min_Production_{p}"
-    
-    # Solve
-    status = prob.solve()
-    
-    if status == pulp.LpStatusOptimal:
-        # Extract results
-        production_quantities = {p: int(production_vars[p].varValue) for p in products}
-        total_profit = pulp.value(prob.objective)
-        
-        # Calculate resource usage
-        resource_usage = {}
-        for resource in resources:
-            used = sum(production_quantities[p] * products[p][resource] for p in products)
-            available = resources[resource]
-            utilization = used / available * 100
-            resource_usage[resource] = {
-                'used': used,
-                'available': available,
-                'utilization': utilization
-            }
-        
-        return {
-            'production_quantities': production_quantities,
-            'total_profit': total_profit,
-            'resource_usage': resource_usage,
-            'products': products
-        }
-    else:
-        return None
+def solve_optimization(optimizer=None):
+    """Solve the optimization problem and return results
+    
+    An optimizer that has already been solved is reused as-is; otherwise the
+    solve is memoized on the problem data so repeated calls skip the solver.
+    Each caller gets its own copy of the memoized results.
+    """
+    if optimizer is None:
+        optimizer = ProductionPlanningOptimizer()
+    
+    if optimizer.results is None:
+        # Key order is kept as-is since it fixes the product/resource order of the charts
+        problem_key = json.dumps({
+            'products': optimizer.products,
+            'resources': optimizer.resources,
+            'min_production': optimizer.min_production
+        })
+        results = _solve_cached(problem_key)
+        if results['status'] != 'Optimal':
+            return None
+        optimizer.results = copy.deepcopy(results)
+    
+    return optimizer.results
 
-def create_comprehensive_visualizations(results):
-    """Create comprehensive visualizations of the optimization results"""
+def create_comprehensive_visualizations(results, output_path='comprehensive_optimization_results.png'):
+    """Create comprehensive visualizations of the optimization results
+    
+    The figure is shown interactively when a display backend is active and
+    saved to output_path otherwise.
+    """
     
     if results is None:
         print("No results to visualize")
         return
     
-    # Set up the plotting area with 2x2 subplots
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('Production Planning Optimization Results', fontsize=18, fontweight='bold')
-    
-    # 1. Production quantities bar chart
-    products = list(results['production_quantities'].keys())
-    quantities = list(results['production_quantities'].values())
-    
-    bars1 = axes[0, 0].bar(products, quantities, color=['#FF6B6B', '#4ECDC4', '#45B7D1'], alpha=0.8)
-    axes[0, 0].set_title('Optimal Production Quantities', fontweight='bold', fontsize=14)
-    axes[0, 0].set_ylabel('Units', fontweight='bold')
-    axes[0, 0].set_ylim(0, max(quantities) * 1.1)
-    axes[0, 0].grid(True, alpha=0.3)
-    
-    # Add value labels on bars
-    for bar, quantity in zip(bars1, quantities):
-        height = bar.get_height()
-        axes[0, 0].text(bar.get_x() + bar.get_width()/2., height + 2,
-                       f'{quantity}', ha='center', va='bottom', fontweight='bold', fontsize=12)
-    
-    # 2. Resource utilization pie chart
-    resources = list(results['resource_usage'].keys())
-    utilizations = [results['resource_usage'][r]['utilization'] for r in resources]
-    colors = ['#FF9999', '#66B2FF', '#99FF99']
-    
-    wedges, texts, autotexts = axes[0, 1].pie(utilizations, labels=resources, autopct='%1.1f%%',
-                                              colors=colors, startangle=90, explode=(0.05, 0.05, 0.05))
-    axes[0, 1].set_title('Resource Utilization', fontweight='bold', fontsize=14)
-    
-    # 3. Profit breakdown
-    profits = [results['production_quantities'][product] * results['products'][product]['profit_per_unit']
-              for product in products]
-    
-    bars2 = axes[1, 0].bar(products, profits, color=['#FFB366', '#FF99CC', '#99CCFF'], alpha=0.8)
-    axes[1, 0].set_title('Profit Contribution by Product', fontweight='bold', fontsize=14)
-    axes[1, 0].set_ylabel('Profit ($)', fontweight='bold')
-    axes[1, 0].grid(True, alpha=0.3)
-    
-    # Add value labels on bars
-    for bar, profit in zip(bars2, profits):
-        height = bar.get_height()
-        axes[1, 0].text(bar.get_x() + bar.get_width()/2., height + 100,
-                       f'${profit:,.0f}', ha='center', va='bottom', fontweight='bold', fontsize=11)
-    
-    # 4. Resource usage comparison
-    resource_names = list(results['resource_usage'].keys())
-    used = [results['resource_usage'][r]['used'] for r in resource_names]
-    available = [results['resource_usage'][r]['available'] for r in resource_names]
-    
-    x = np.arange(len(resource_names))
-    width = 0.35
-    
-    bars3 = axes[1, 1].bar(x - width/2, used, width, label='Used', color='#FF6B6B', alpha=0.8)
-    bars4 = axes[1, 1].bar(x + width/2, available, width, label='Available', color='#4ECDC4', alpha=0.8)
-    
-    axes[1, 1].set_title('Resource Usage vs Availability', fontweight='bold', fontsize=14)
-    axes[1, 1].set_ylabel('Hours/Kg', fontweight='bold')
-    axes[1, 1].set_xticks(x)
-    axes[1, 1].set_xticklabels(resource_names)
-    axes[1, 1].legend()
-    axes[1, 1].grid(True, alpha=0.3)
-    
-    # Add value labels
-    for bar in bars3:
-        height = bar.get_height()
-        axes[1, 1].text(bar.get_x() + bar.get_width()/2., height + 5,
-                       f'{height:.0f}', ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    plt.tight_layout()
-    plt.show()
+    with plt.style.context(PLOT_STYLE):
+        # Set up the plotting area with 2x2 subplots
+        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig.suptitle('Production Planning Optimization Results', fontsize=18, fontweight='bold')
+        
+        # 1. Production quantities bar chart
+        products = list(results['production_quantities'].keys())
+        quantities = list(results['production_quantities'].values())
+        
+        bars1 = axes[0, 0].bar(products, quantities, color=['#FF6B6B', '#4ECDC4', '#45B7D1'], alpha=0.8)
+        axes[0, 0].set_title('Optimal Production Quantities', fontweight='bold', fontsize=14)
+        axes[0, 0].set_ylabel('Units', fontweight='bold')
+        axes[0, 0].set_ylim(0, results['max_quantity'] * 1.1)
+        axes[0, 0].grid(True, alpha=0.3)
+        
+        # Add value labels on bars
+        axes[0, 0].bar_label(bars1, labels=[f'{q}' for q in quantities], padding=3,
+                             fontweight='bold', fontsize=12)
+        
+        # 2. Resource utilization bar chart
+        resources = list(results['resource_usage'].keys())
+        utilizations = [results['resource_usage'][r]['utilization'] for r in resources]
+        colors = ['#FF9999', '#66B2FF', '#99FF99']
+        
+        bars_util = axes[0, 1].barh(resources, utilizations, color=colors, alpha=0.8)
+        axes[0, 1].set_title('Resource Utilization', fontweight='bold', fontsize=14)
+        axes[0, 1].set_xlabel('Utilization (%)', fontweight='bold')
+        axes[0, 1].set_xlim(0, UTILIZATION_AXIS_MAX)
+        axes[0, 1].grid(True, alpha=0.3)
+        axes[0, 1].bar_label(bars_util, fmt='%.1f%%', padding=3, fontweight='bold', fontsize=11)
+        
+        # 3. Profit breakdown
+        profits = [results['profit_contribution'][product] for product in products]
+        
+        bars2 = axes[1, 0].bar(products, profits, color=['#FFB366', '#FF99CC', '#99CCFF'], alpha=0.8)
+        axes[1, 0].set_title('Profit Contribution by Product', fontweight='bold', fontsize=14)
+        axes[1, 0].set_ylabel('Profit ($)', fontweight='bold')
+        axes[1, 0].grid(True, alpha=0.3)
+        
+        # Add value labels on bars
+        axes[1, 0].bar_label(bars2, labels=[f'${p:,.0f}' for p in profits], padding=3,
+                             fontweight='bold', fontsize=11)
+        
+        # 4. Resource usage comparison
+        resource_names = list(results['resource_usage'].keys())
+        used = [results['resource_usage'][r]['used'] for r in resource_names]
+        available = [results['resource_usage'][r]['available'] for r in resource_names]
+        
+        x = np.arange(len(resource_names))
+        width = 0.35
+        
+        bars3 = axes[1, 1].bar(x - width/2, used, width, label='Used', color='#FF6B6B', alpha=0.8)
+        bars4 = axes[1, 1].bar(x + width/2, available, width, label='Available', color='#4ECDC4', alpha=0.8)
+        
+        axes[1, 1].set_title('Resource Usage vs Availability', fontweight='bold', fontsize=14)
+        axes[1, 1].set_ylabel('Hours/Kg', fontweight='bold')
+        axes[1, 1].set_xticks(x)
+        axes[1, 1].set_xticklabels(resource_names)
+        axes[1, 1].legend()
+        axes[1, 1].grid(True, alpha=0.3)
+        
+        # Add value labels
+        axes[1, 1].bar_label(bars3, labels=[f'{u:.0f}' for u in used], padding=3,
+                             fontsize=10, fontweight='bold')
+        
+        plt.tight_layout()
+        save_or_show(fig, output_path)
     
     # Additional chart: Profit vs Resource Efficiency
     print(f"\n📊 Total Profit: ${results['total_profit']:,.2f}")
-    print(f"📈 Most Constrained Resource: {max(results['resource_usage'].items(), key=lambda x: x[1]['utilization'])[0]}")
+    print(f"📈 Most Constrained Resource: {results['most_constrained_resource']}")
 
 def main():
     """Main function to run optimization and generate charts"""
@@ -211,4 +149,5 @@ def main():
         print("❌ Failed to solve optimization problem")
 
 if __name__ == "__main__":
+    select_backend()
     main() 
\ No newline at end of file
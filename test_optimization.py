@@ -3,110 +3,277 @@
 Simplified test of the production planning optimization
 """
 
-import pulp
-import warnings
-warnings.filterwarnings('ignore')
+import itertools
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+from scipy.optimize import linprog
+from business_optimization_production_planning import SOLVER_OPTIONS, ProductionPlanningOptimizer, save_or_show
+import generate_charts
 
-def test_optimization():
-    """Test the optimization without visualizations"""
+# Test problem in structure-of-arrays form: one array per field, indexed by product position
+PRODUCTS = ['Product_A', 'Product_B', 'Product_C']
+PROFIT = np.array([50, 75, 60], dtype=float)
+LABOR = np.array([2, 3, 2.5])
+MACHINE = np.array([1.5, 2, 1.8])
+MATERIAL = np.array([3, 4, 3.5])
+MAX_DEMAND = np.array([100, 80, 120])
+MIN_PROD = np.array([20, 15, 25])
+
+# Resource limits, in the same order as the LABOR, MACHINE and MATERIAL rows
+RESOURCES = ['labor_hours', 'machine_hours', 'raw_material']
+CAPACITY = np.array([400, 300, 1000])
+
+def build_model(product_names, resource_names, profit, resource_rows, max_demand):
+    """Build the parts of the model that depend only on the product data"""
     
-    # Product information
-    products = {
-        'Product_A': {
-            'profit_per_unit': 50,
-            'labor_hours': 2,
-            'machine_hours': 1.5,
-            'raw_material': 3,
-            'max_demand': 100
-        },
-        'Product_B': {
-            'profit_per_unit': 75,
-            'labor_hours': 3,
-            'machine_hours': 2,
-            'raw_material': 4,
-            'max_demand': 80
-        },
-        'Product_C': {
-            'profit_per_unit': 60,
-            'labor_hours': 2.5,
-            'machine_hours': 1.8,
-            'raw_material': 3.5,
-            'max_demand': 120
-        }
+    return {
+        'product_names': list(product_names),
+        'resource_names': list(resource_names),
+        # Objective (linprog minimizes, so profits are negated)
+        'c': -np.asarray(profit, dtype=float),
+        # One row per resource, one column per product
+        'A_ub': np.vstack(resource_rows).astype(float),
+        'max_demand': np.asarray(max_demand)
     }
+
+def product_arrays(products, resource_names):
+    """Convert product dicts to the per-field arrays build_model takes"""
     
-    # Resource constraints
-    resources = {
-        'labor_hours': 400,
-        'machine_hours': 300,
-        'raw_material': 1000
-    }
+    return (list(products), list(resource_names),
+            np.array([info['profit_per_unit'] for info in products.values()]),
+            np.array([[info[r] for info in products.values()] for r in resource_names]),
+            np.array([info['max_demand'] for info in products.values()]))
+
+def scenario_arrays(model, resources, min_production):
+    """Convert resource limit and minimum production dicts to arrays in the model's order"""
     
-    # Minimum production requirements
-    min_production = {
-        'Product_A': 20,
-        'Product_B': 15,
-        'Product_C': 25
-    }
+    return (np.array([resources[r] for r in model['resource_names']]),
+            np.array([min_production[p] for p in model['product_names']]))
+
+def solve_scenario(model, capacity, min_production, integer=True):
+    """Solve a built model for one set of resource limits and minimum production levels"""
     
-    print("🏭 PRODUCTION PLANNING OPTIMIZATION TEST")
-    print("=" * 50)
+    # Minimum production and maximum demand as variable bounds
+    bounds = np.column_stack([min_production, model['max_demand']])
+    return linprog(model['c'], A_ub=model['A_ub'], b_ub=capacity, bounds=bounds, method='highs',
+                   integrality=np.ones(len(bounds)) if integer else None, options=SOLVER_OPTIONS)
+
+def enumerate_vertices(c, A_ub, b_ub, bounds):
+    """Solve a small LP without a solver by checking every vertex of the feasible region"""
     
-    # Create the optimization problem
-    prob = pulp.LpProblem("Production_Planning_Optimization", pulp.LpMaximize)
+    n = len(c)
+    lower, upper = np.array(bounds, dtype=float).T
+    # All constraints as G @ x <= h: resource rows, then upper and lower bounds
+    G = np.vstack([A_ub, np.eye(n), -np.eye(n)])
+    h = np.concatenate([b_ub, upper, -lower])
     
-    # Decision variables
-    production_vars = pulp.LpVariable.dicts("Production", products.keys(), lowBound=0, cat='Integer')
+    best_x, best_obj = None, np.inf
+    for active in itertools.combinations(range(len(h)), n):
+        rows = list(active)
+        try:
+            x = np.linalg.solve(G[rows], h[rows])
+        except np.linalg.LinAlgError:
+            continue  # These constraints do not meet in a single point
+        if np.all(G @ x <= h + 1e-9) and c @ x < best_obj:
+            best_x, best_obj = x, c @ x
+    return best_x, best_obj
+
+def run_production_plan(verbose=False):
+    """Solve the test problem and return its results, printing a report when verbose"""
     
-    # Objective function: Maximize total profit
-    prob += pulp.lpSum([products[p]['profit_per_unit'] * production_vars[p] for p in products]), "Total_Profit"
+    if verbose:
+        print("🏭 PRODUCTION PLANNING OPTIMIZATION TEST")
+        print("=" * 50)
     
-    # Constraints
-    # Labor hours
-    prob += pulp.lpSum([products[p]['labor_hours'] * production_vars[p] for p in products]) <= resources['labor_hours'], "Labor_Hours_Limit"
-    # Machine hours
-    prob += pulp.lpSum([products[p]['machine_hours'] * production_vars[p] for p in products]) <= resources['machine_hours'], "Machine_Hours_Limit"
-    # Raw material
-    prob += pulp.lpSum([products[p]['raw_material'] * production_vars[p] for p in products]) <= resources['raw_material'], "Raw_Material_Limit"
-    # Maximum demand
-    for p in products:
-        prob += production_vars[p] <= products[p]['max_demand'], f"Max_Demand_{p}"
-    # Minimum production
-    for p in products:
-        prob += production_vars[p] >= min_production[p], f"Min_Production_{p}"
+    # Create the optimization problem from the arrays
+    model = build_model(PRODUCTS, RESOURCES, PROFIT, [LABOR, MACHINE, MATERIAL], MAX_DEMAND)
     
-    print("🔧 Model created successfully!")
+    if verbose:
+        print("🔧 Model created successfully!")
     
     # Solve
-    status = prob.solve()
-    print(f"🚀 Solution status: {pulp.LpStatus[prob.status]}")
+    res = solve_scenario(model, CAPACITY, MIN_PROD)
+    if verbose:
+        print(f"🚀 Solution status: {res.message}")
     
-    if status == pulp.LpStatusOptimal:
-        print("✅ Optimal solution found!")
-        
+    if res.status == 0:
         # Extract results
-        production_quantities = {p: int(production_vars[p].varValue) for p in products}
-        total_profit = pulp.value(prob.objective)
-        
-        print(f"\n📊 RESULTS:")
-        print(f"🎯 Total Profit: ${total_profit:,.2f}")
-        print(f"\n📦 Production Quantities:")
-        for p, q in production_quantities.items():
-            profit = q * products[p]['profit_per_unit']
-            print(f"  {p}: {q} units (${profit:,.2f} profit)")
-        
-        print(f"\n⚙️ Resource Utilization:")
-        for resource in resources:
-            used = sum(production_quantities[p] * products[p][resource] for p in products)
-            available = resources[resource]
-            utilization = used / available * 100
-            print(f"  {resource}: {used:.1f} / {available} ({utilization:.1f}%)")
+        x = np.rint(res.x).astype(int)
+        production_quantities = dict(zip(PRODUCTS, x.tolist()))
+        # Profit and resource usage of the rounded plan, not the solver's floats
+        total_profit, used_vec = PROFIT @ x, model['A_ub'] @ x
+        utilization = used_vec / CAPACITY * 100
         
-        print(f"\n✅ Optimization completed successfully!")
-        return True
+        if verbose:
+            print("✅ Optimal solution found!")
+            print(f"\n📊 RESULTS:")
+            print(f"🎯 Total Profit: ${float(total_profit):,.2f}")
+            print(f"\n📦 Production Quantities:")
+            for p, q, profit in zip(PRODUCTS, x, PROFIT * x):
+                print(f"  {p}: {q} units (${profit:,.2f} profit)")
+            
+            print(f"\n⚙️ Resource Utilization:")
+            for resource, used, limit, pct in zip(RESOURCES, used_vec, CAPACITY, utilization):
+                print(f"  {resource}: {used:.1f} / {limit} ({pct:.1f}%)")
+            
+            print(f"\n✅ Optimization completed successfully!")
+        return {
+            'status': 'Optimal',
+            'quantities': production_quantities,
+            'profit': float(total_profit),
+            'utilization': dict(zip(RESOURCES, utilization.tolist()))
+        }
     else:
-        print(f"❌ No optimal solution found. Status: {pulp.LpStatus[status]}")
-        return False
+        if verbose:
+            print(f"❌ No optimal solution found. Status: {res.message}")
+        return {'status': 'Infeasible', 'message': f'Problem status: {res.message}'}
+
+def test_optimization():
+    """Test the optimization without visualizations"""
+    
+    results = run_production_plan()
+    
+    assert results['status'] == 'Optimal'
+    assert results['quantities'] == {'Product_A': 49, 'Product_B': 79, 'Product_C': 26}
+    assert results['profit'] == 9935
+    assert all(0 <= pct <= 100 for pct in results['utilization'].values())
+
+def test_optimizer_solve_results():
+    """Test the optimizer's own solve and the fields of its results dict"""
+    
+    optimizer = ProductionPlanningOptimizer()
+    results = optimizer.solve_optimization()
+    
+    assert results['status'] == 'Optimal'
+    assert results['production_quantities'] == {'Product_A': 49, 'Product_B': 79, 'Product_C': 26}
+    assert results['total_profit'] == 9935
+    assert results['profit_contribution'] == {'Product_A': 2450, 'Product_B': 5925, 'Product_C': 1560}
+    assert results['constraint_analysis']['Labor_Hours_Limit'] == 0
+    assert results['constraint_analysis']['Max_Demand_Product_B'] == -1
+    assert results['constraint_analysis']['Min_Production_Product_C'] == 1
+    assert results['resource_usage']['labor_hours'] == {'used': 400, 'available': 400, 'utilization': 100}
+    assert np.isclose(results['resource_usage']['machine_hours']['used'], 278.3)
+    assert results['max_quantity'] == 79
+    assert results['max_utilization'] == 100
+    assert results['most_constrained_resource'] == 'labor_hours'
+
+def test_fractional_relaxation_falls_back_to_integer_solve():
+    """Test that a base case with a fractional LP relaxation still yields whole units"""
+    
+    optimizer = ProductionPlanningOptimizer()
+    problem = optimizer.create_optimization_model()
+    relaxed = linprog(problem['c'], A_ub=problem['A_ub'], b_ub=problem['b_ub'],
+                      bounds=problem['bounds'], method='highs', options=SOLVER_OPTIONS)
+    assert not np.allclose(relaxed.x, np.rint(relaxed.x))  # 48.75 units of Product_A
+    
+    res = optimizer._solve_with_objective(problem['c'])
+    
+    assert res.status == 0
+    assert np.allclose(res.x, [49, 79, 26])
+    assert np.isclose(-res.fun, 9935)
+
+def test_solve_scenario_reuses_model():
+    """Test that one built model can be solved for several resource scenarios"""
+    
+    optimizer = ProductionPlanningOptimizer()
+    model = build_model(*product_arrays(optimizer.products, optimizer.resources))
+    
+    capacity, min_production = scenario_arrays(model, optimizer.resources, optimizer.min_production)
+    
+    base = solve_scenario(model, capacity, min_production)
+    more_labor = solve_scenario(model, capacity + [100, 0, 0], min_production)  # 500 labor hours
+    
+    assert base.status == 0 and more_labor.status == 0
+    assert round(-base.fun) == 9935
+    assert -more_labor.fun > -base.fun  # Labor hours are the binding resource
+
+def test_lp_relaxation_matches_vertex_enumeration():
+    """Test the solver's LP relaxation against a brute-force vertex search"""
+    
+    optimizer = ProductionPlanningOptimizer()
+    model = build_model(*product_arrays(optimizer.products, optimizer.resources))
+    capacity, min_production = scenario_arrays(model, optimizer.resources, optimizer.min_production)
+    bounds = np.column_stack([min_production, model['max_demand']])
+    
+    relaxed = solve_scenario(model, capacity, min_production, integer=False)
+    integer = solve_scenario(model, capacity, min_production)
+    _, vertex_obj = enumerate_vertices(model['c'], model['A_ub'], capacity, bounds)
+    
+    assert np.isclose(relaxed.fun, vertex_obj)
+    assert -integer.fun <= -vertex_obj + 1e-6  # The relaxation bounds the integer optimum
+
+def test_sensitivity_analysis_preserves_products():
+    """Test that sensitivity scenarios leave the optimizer's product data untouched"""
+    
+    optimizer = ProductionPlanningOptimizer()
+    base_profits = {p: data['profit_per_unit'] for p, data in optimizer.products.items()}
+    
+    sensitivity_results = optimizer.sensitivity_analysis()
+    
+    assert {p: data['profit_per_unit'] for p, data in optimizer.products.items()} == base_profits
+    for scenario in ('High Profit A', 'High Profit B', 'High Profit C'):
+        assert sensitivity_results[scenario]['total_profit'] > sensitivity_results['Base Case']['total_profit']
+
+def test_sensitivity_scenarios_keep_custom_product_names_apart():
+    """Test that custom product keys sharing a suffix get separate sensitivity scenarios"""
+    
+    optimizer = ProductionPlanningOptimizer()
+    renames = {'Product_A': 'Widget_Large', 'Product_B': 'Gadget_Large', 'Product_C': 'Product_C'}
+    optimizer.products = {renames[p]: data for p, data in optimizer.products.items()}
+    optimizer.min_production = {renames[p]: value for p, value in optimizer.min_production.items()}
+    
+    sensitivity_results = optimizer.sensitivity_analysis()
+    
+    assert list(sensitivity_results) == ['Base Case', 'High Profit Widget_Large',
+                                         'High Profit Gadget_Large', 'High Profit C']
+    
+    # A short key must not collide with the shortened form of a 'Product_' key
+    renames = {'Product_A': 'Product_X', 'Product_B': 'X', 'Product_C': 'Product_C'}
+    optimizer = ProductionPlanningOptimizer()
+    optimizer.products = {renames[p]: data for p, data in optimizer.products.items()}
+    optimizer.min_production = {renames[p]: value for p, value in optimizer.min_production.items()}
+    
+    assert list(optimizer.sensitivity_analysis()) == ['Base Case', 'High Profit Product_X',
+                                                      'High Profit X', 'High Profit C']
+
+def test_cached_chart_results_are_independent():
+    """Test that mutating one optimizer's memoized results leaves the next caller's intact"""
+    
+    first = generate_charts.solve_optimization(ProductionPlanningOptimizer())
+    first['production_quantities']['Product_A'] = 0
+    second = generate_charts.solve_optimization(ProductionPlanningOptimizer())
+    
+    assert second is not first
+    assert second['production_quantities']['Product_A'] == 49
+
+def test_results_figure_redrawn_when_capacity_changes(tmp_path):
+    """Test that a capacity change keeping the same plan does not reuse the cached figure"""
+    
+    optimizer = ProductionPlanningOptimizer()
+    optimizer.solve_optimization()
+    first = optimizer.create_visualizations(tmp_path / 'first.png')
+    assert optimizer.create_visualizations(tmp_path / 'first.png') is first
+    
+    optimizer.resources['raw_material'] = 2000  # Not binding, so the plan stays the same
+    optimizer.problem = None
+    optimizer.solve_optimization()
+    second = optimizer.create_visualizations(tmp_path / 'second.png')
+    plt.close('all')
+    
+    assert optimizer.results['production_quantities'] == {'Product_A': 49, 'Product_B': 79, 'Product_C': 26}
+    assert second is not first
+
+def test_save_or_show_saves_on_file_only_backends(tmp_path, monkeypatch):
+    """Test that figures are written to disk on any non-interactive backend, not just Agg"""
+    
+    monkeypatch.setattr(matplotlib, 'get_backend', lambda: 'svg')
+    fig = plt.figure()
+    
+    save_or_show(fig, tmp_path / 'chart.png')
+    plt.close(fig)
+    
+    assert (tmp_path / 'chart.png').exists()
 
 if __name__ == "__main__":
-    test_optimization() 
\ No newline at end of file
+    run_production_plan(verbose=True)
\ No newline at end of file